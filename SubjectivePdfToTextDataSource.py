@@ -3,17 +3,400 @@ SubjectivePdfToTextDataSource - Subjective Technologies Data Source
 Batch data source for converting PDF documents to JSON context files
 """
 
+import io
 import os
+import gzip
 import sys
 import json
+import time
+import mmap
+import stat
 import logging
 import hashlib
-from typing import Dict, Any, List, Optional
+import functools
+import multiprocessing
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
-from PyPDF2 import PdfReader
-from PyPDF2.errors import EmptyFileError
 from subjective_abstract_data_source_package import SubjectiveDataSource
 
+try:
+    import pymupdf
+except ImportError:
+    try:
+        # PyMuPDF releases before the pymupdf module name only ship fitz
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+
+SUPPORTED_BACKENDS = ('pymupdf', 'pypdfium2')
+DEFAULT_BACKEND = 'pymupdf'
+
+SUPPORTED_HASH_ALGORITHMS = ('sha256', 'blake3')
+DEFAULT_HASH_ALGORITHM = 'sha256'
+
+SUPPORTED_OUTPUT_COMPRESSIONS = ('none', 'gzip', 'zstd')
+DEFAULT_OUTPUT_COMPRESSION = 'none'
+OUTPUT_COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+GZIP_COMPRESSION_LEVEL = 6
+ZSTD_COMPRESSION_LEVEL = 3
+
+# Read size for hashing files that cannot be memory-mapped
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Local-time ISO 8601 format (second precision) for metadata timestamps
+ISO_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# The PDF header must appear within the first 1024 bytes of the file
+PDF_MAGIC = b'%PDF-'
+PDF_HEADER_SEARCH_SIZE = 1024
+
+# Separators written around page text when assembling full_text. With page
+# numbers every page is preceded by "\n--- Page N ---\n" and all parts are
+# joined by a newline; the join newlines are folded into the constants.
+FIRST_PAGE_HEADER_PREFIX = "\n--- Page "
+PAGE_HEADER_PREFIX = "\n\n--- Page "
+PAGE_HEADER_SUFFIX = " ---\n\n"
+PAGE_SEPARATOR = "\n\n"
+
+# The processed-pages counter is updated about this many times per document (every
+# page for documents shorter than that); the progress callback itself only fires
+# once, when fetch completes
+PROGRESS_UPDATES_PER_DOCUMENT = 20
+
+# Page extraction runs in-process unless num_workers is raised
+DEFAULT_NUM_WORKERS = 1
+
+# Below this page count the cost of starting worker processes outweighs the gain.
+# PyMuPDF extracts a page in about 1.4 ms while starting a pool takes in the order
+# of a second, so a pool of 4 only breaks even somewhere around a thousand pages.
+PARALLEL_MIN_PAGES = 1000
+
+
+# Directory containing this module, where icon.svg is looked up
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Fallback SVG icon for PDF to text, used when icon.svg is missing
+FALLBACK_ICON_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="64" height="64" viewBox="0 0 64 64" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="gradient" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" style="stop-color:#4ECDC4;stop-opacity:1" />
+      <stop offset="100%" style="stop-color:#4ECDC480;stop-opacity:1" />
+    </linearGradient>
+  </defs>
+  
+  <!-- Background circle -->
+  <circle cx="32" cy="32" r="30" fill="url(#gradient)" stroke="#333" stroke-width="2"/>
+  
+  <!-- PDF icon symbol -->
+  <text x="32" y="42" font-family="Arial, sans-serif" font-size="24" text-anchor="middle" fill="white">
+    📄
+  </text>
+  
+  <!-- Data source type indicator -->
+  <text x="32" y="56" font-family="Arial, sans-serif" font-size="8" text-anchor="middle" fill="#333">
+    PDF→JSON
+  </text>
+  
+  <!-- Corner indicator for Subjective Technologies -->
+  <circle cx="52" cy="12" r="8" fill="#333" opacity="0.8"/>
+  <text x="52" y="16" font-family="Arial, sans-serif" font-size="8" text-anchor="middle" fill="white">S</text>
+</svg>'''
+
+
+@functools.cache
+def _load_icon(dir_path: str) -> str:
+    """Read icon.svg from dir_path once, falling back to FALLBACK_ICON_SVG."""
+    icon_path = os.path.join(dir_path, "icon.svg")
+    if os.path.exists(icon_path):
+        with open(icon_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    return FALLBACK_ICON_SVG
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _hash_file(file_path: str, algorithm: str, multithreaded: bool = False) -> str:
+    """
+    Compute the hex digest of a file.
+    
+    Args:
+        file_path: Path to the file
+        algorithm: "sha256" or "blake3"
+        multithreaded: Let BLAKE3 hash a single file on all cores (ignored for SHA256)
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    if algorithm == 'blake3':
+        file_hash = blake3(max_threads=blake3.AUTO) if multithreaded else blake3()
+        file_hash.update_mmap(file_path)
+        return file_hash.hexdigest()
+    
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        try:
+            # Hash the whole file as one zero-copy buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256_hash.update(mm)
+            return sha256_hash.hexdigest()
+        except (ValueError, OSError, OverflowError):
+            # Empty files, files larger than the address space, or
+            # file systems without mmap support
+            pass
+        for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def _backend_available(backend: str) -> bool:
+    """Check whether the library behind a text extraction backend is installed."""
+    if backend == 'pymupdf':
+        return pymupdf is not None
+    if backend == 'pypdfium2':
+        return pdfium is not None
+    return False
+
+
+def _open_pdf(pdf_path: str, backend: str = DEFAULT_BACKEND):
+    """
+    Open a PDF document with the given backend.
+    
+    This is the only place a PDF is opened, so swapping or adding a backend
+    starts here.
+    """
+    if backend == 'pymupdf':
+        return pymupdf.open(pdf_path)
+    if backend == 'pypdfium2':
+        return pdfium.PdfDocument(pdf_path)
+    raise ValueError(f"Unsupported PDF backend: {backend}")
+
+
+def _close_document(document) -> None:
+    """Release a document opened with _open_pdf (both backends expose close())."""
+    document.close()
+
+
+def _document_page_count(document, backend: str) -> int:
+    """Return the number of pages of an opened document."""
+    if backend == 'pymupdf':
+        return document.page_count
+    return len(document)
+
+
+def _extract_page_text(document, page_num: int, backend: str) -> str:
+    """
+    Extract the text of a single (zero-based) page of an opened document.
+    
+    Pages without a content stream (blank pages) return an empty string without
+    running the text extractor.
+    """
+    if backend == 'pymupdf':
+        page = document[page_num]
+        if not page.get_contents():
+            return ''
+        return page.get_text("text")
+    page = document[page_num]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+
+# Document opened by _extract_page inside a worker process. Kept per process so
+# that a worker opens the PDF once rather than once per page; documents are not
+# fork-safe, so each worker must open its own.
+_worker_document = None
+_worker_document_key = None
+
+
+def _noop() -> None:
+    """Task submitted to a new process pool to make it start its workers."""
+
+
+def _extract_page(pdf_path: str, page_num: int, backend: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract the text of a single page in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: Zero-based page index
+        backend: Text extraction backend
+        
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Page text and error message (one of them is None)
+    """
+    global _worker_document, _worker_document_key
+    try:
+        if _worker_document_key != (pdf_path, backend):
+            if _worker_document is not None:
+                _close_document(_worker_document)
+                _worker_document = None
+            _worker_document = _open_pdf(pdf_path, backend)
+            _worker_document_key = (pdf_path, backend)
+        return _extract_page_text(_worker_document, page_num, backend), None
+    except Exception as e:
+        return None, str(e)
+
+
+# Connection description returned by get_connection_data; shared, treat as read-only
+_CONNECTION_DATA = {
+    "connection_type": "FileSystem",
+    "fields": {
+        "pdf_file_path": {
+            "type": "string",
+            "required": True,
+            "description": "Path to the PDF file to convert"
+        },
+        "output_file_path": {
+            "type": "string", 
+            "required": False,
+            "description": "Path for output JSON file (defaults to PDF name with .json extension)"
+        },
+        "include_page_numbers": {
+            "type": "bool",
+            "required": False,
+            "default": True,
+            "description": "Whether to include page numbers in extracted text"
+        },
+        "backend": {
+            "type": "string",
+            "required": False,
+            "default": DEFAULT_BACKEND,
+            "description": "Text extraction backend: pymupdf or pypdfium2"
+        },
+        "num_workers": {
+            "type": "int",
+            "required": False,
+            "description": f"Number of processes used for page extraction of documents with {PARALLEL_MIN_PAGES}+ pages (default: 1)"
+        },
+        "pretty_print": {
+            "type": "bool",
+            "required": False,
+            "default": False,
+            "description": "Whether to indent the output JSON"
+        },
+        "hash_algorithm": {
+            "type": "string",
+            "required": False,
+            "default": DEFAULT_HASH_ALGORITHM,
+            "description": "Algorithm for the PDF file hash: sha256 or blake3"
+        },
+        "store_per_page": {
+            "type": "bool",
+            "required": False,
+            "default": True,
+            "description": "Whether to keep per-page text in content.pages"
+        },
+        "output_compression": {
+            "type": "string",
+            "required": False,
+            "default": DEFAULT_OUTPUT_COMPRESSION,
+            "description": "Compression of the output file: none, gzip or zstd"
+        }
+    }
+}
+
+# Parameter metadata returned by get_connection_metadata; shared, treat as read-only
+_CONNECTION_METADATA = {
+    'pdf_file_path': {
+        'description': 'Path to the PDF file to convert to JSON',
+        'type': 'string',
+        'required': True,
+        'default': '',
+        'sensitive': False
+    },
+    'output_file_path': {
+        'description': 'Path for output JSON file (optional, defaults to PDF name with .json extension)',
+        'type': 'string',
+        'required': False,
+        'default': '',
+        'sensitive': False
+    },
+    'include_page_numbers': {
+        'description': 'Whether to include page numbers in extracted text',
+        'type': 'bool',
+        'required': False,
+        'default': True,
+        'sensitive': False
+    },
+    'backend': {
+        'description': 'Text extraction backend: pymupdf (default) or pypdfium2',
+        'type': 'string',
+        'required': False,
+        'default': DEFAULT_BACKEND,
+        'sensitive': False
+    },
+    'num_workers': {
+        'description': f'Number of processes used for page extraction of documents with {PARALLEL_MIN_PAGES}+ pages (optional, default: 1)',
+        'type': 'int',
+        'required': False,
+        'default': '',
+        'sensitive': False
+    },
+    'pretty_print': {
+        'description': 'Whether to indent the output JSON (larger and slower to write)',
+        'type': 'bool',
+        'required': False,
+        'default': False,
+        'sensitive': False
+    },
+    'hash_algorithm': {
+        'description': 'Algorithm for the PDF file hash: sha256 (default) or blake3',
+        'type': 'string',
+        'required': False,
+        'default': DEFAULT_HASH_ALGORITHM,
+        'sensitive': False
+    },
+    'store_per_page': {
+        'description': 'Whether to keep per-page text in content.pages (disable to output full_text only)',
+        'type': 'bool',
+        'required': False,
+        'default': True,
+        'sensitive': False
+    },
+    'output_compression': {
+        'description': 'Compression of the output file: none (default), gzip (.gz) or zstd (.zst)',
+        'type': 'string',
+        'required': False,
+        'default': DEFAULT_OUTPUT_COMPRESSION,
+        'sensitive': False
+    }
+}
+
 
 class SubjectivePdfToTextDataSource(SubjectiveDataSource):
     """
@@ -38,6 +421,12 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
                 - pdf_file_path: Path to the PDF file (required)
                 - output_file_path: Path for output JSON file (optional, defaults to PDF name with .json extension)
                 - include_page_numbers: Whether to include page numbers in text (default: True)
+                - backend: Text extraction backend, "pymupdf" or "pypdfium2" (default: "pymupdf")
+                - num_workers: Number of processes used for page extraction (default: 1)
+                - pretty_print: Whether to indent the output JSON (default: False)
+                - hash_algorithm: Algorithm for the PDF file hash, "sha256" or "blake3" (default: "sha256")
+                - store_per_page: Whether to keep per-page text in content.pages (default: True)
+                - output_compression: Compression of the output file, "none", "gzip" or "zstd" (default: "none")
         """
         super().__init__(name, session, dependency_data_sources, subscribers, params)
         
@@ -49,6 +438,24 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
         self.pdf_file_path = self.params.get('pdf_file_path', '')
         self.output_file_path = self.params.get('output_file_path', '')
         self.include_page_numbers = self.params.get('include_page_numbers', True)
+        self.backend = (self.params.get('backend') or DEFAULT_BACKEND).lower()
+        # Parsed and checked in validate_config
+        self.num_workers = self.params.get('num_workers')
+        if self.num_workers is None or self.num_workers == '':
+            self.num_workers = DEFAULT_NUM_WORKERS
+        self.pretty_print = self.params.get('pretty_print', False)
+        self.hash_algorithm = (self.params.get('hash_algorithm') or DEFAULT_HASH_ALGORITHM).lower()
+        self.store_per_page = self.params.get('store_per_page', True)
+        self.output_compression = (self.params.get('output_compression') or DEFAULT_OUTPUT_COMPRESSION).lower()
+        
+        # Path details and os.stat result of the PDF, cached by validate_config
+        self._pdf_stat = None
+        self._pdf_abspath = None
+        self._pdf_basename = None
+        self._pdf_stem = None
+        
+        # File hash computed ahead of fetch by fetch_batch
+        self._precomputed_file_hash = None
         
         # Initialize progress tracking
         self._total_items = 0
@@ -71,7 +478,12 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
             self.logger.error("PDF file path is required")
             return False
         
-        if not os.path.isfile(self.pdf_file_path):
+        try:
+            self._pdf_stat = os.stat(self.pdf_file_path)
+        except OSError:
+            self._pdf_stat = None
+        
+        if self._pdf_stat is None or not stat.S_ISREG(self._pdf_stat.st_mode):
             self.logger.error(f"PDF file does not exist: {self.pdf_file_path}")
             return False
         
@@ -79,44 +491,215 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
             self.logger.error(f"File is not a PDF: {self.pdf_file_path}")
             return False
         
+        if self.backend not in SUPPORTED_BACKENDS:
+            self.logger.error(f"Unsupported PDF backend: {self.backend}")
+            return False
+        
+        if not _backend_available(self.backend):
+            self.logger.error(f"PDF backend '{self.backend}' is not installed")
+            return False
+        
+        try:
+            self.num_workers = int(self.num_workers)
+        except (TypeError, ValueError):
+            self.logger.error(f"num_workers must be an integer: {self.num_workers!r}")
+            return False
+        
+        if self.num_workers < 1:
+            self.logger.error(f"num_workers must be at least 1: {self.num_workers}")
+            return False
+        
+        if self.hash_algorithm not in SUPPORTED_HASH_ALGORITHMS:
+            self.logger.error(f"Unsupported hash algorithm: {self.hash_algorithm}")
+            return False
+        
+        if self.hash_algorithm == 'blake3' and blake3 is None:
+            self.logger.error("Hash algorithm 'blake3' requires the blake3 package")
+            return False
+        
+        if self.output_compression not in SUPPORTED_OUTPUT_COMPRESSIONS:
+            self.logger.error(f"Unsupported output compression: {self.output_compression}")
+            return False
+        
+        if self.output_compression == 'zstd' and zstd is None:
+            self.logger.error("Output compression 'zstd' requires the zstandard package")
+            return False
+        
+        self._pdf_abspath = os.path.abspath(self.pdf_file_path)
+        self._pdf_basename = os.path.basename(self.pdf_file_path)
+        self._pdf_stem = os.path.splitext(self._pdf_basename)[0]
+        
         # Set default output path if not provided
         if not self.output_file_path:
-            base_name = os.path.splitext(os.path.basename(self.pdf_file_path))[0]
             output_dir = os.path.dirname(self.pdf_file_path) or '.'
-            self.output_file_path = os.path.join(output_dir, f"{base_name}.json")
+            self.output_file_path = os.path.join(output_dir, f"{self._pdf_stem}.json")
             self.logger.info(f"Using default output path: {self.output_file_path}")
         
+        # Compressed output gets the matching file suffix
+        suffix = OUTPUT_COMPRESSION_SUFFIXES.get(self.output_compression)
+        if suffix and not self.output_file_path.endswith(suffix):
+            self.output_file_path += suffix
+        
         self.logger.info("Configuration validation passed")
         return True
     
     def is_valid_pdf(self, pdf_path: str) -> bool:
-        """Check if a PDF file is valid and not empty."""
-        if not os.path.isfile(pdf_path) or os.path.getsize(pdf_path) == 0:
-            return False
+        """
+        Check if a file looks like a non-empty PDF.
+        
+        Only the file header is inspected; the document itself is parsed once,
+        by the extraction that follows.
+        """
         try:
-            PdfReader(pdf_path)
-            return True
-        except Exception:
+            if not os.path.isfile(pdf_path) or os.path.getsize(pdf_path) == 0:
+                return False
+            with open(pdf_path, 'rb') as f:
+                return PDF_MAGIC in f.read(PDF_HEADER_SEARCH_SIZE)
+        except OSError:
             return False
     
-    def compute_file_hash(self, file_path: str) -> str:
-        """Compute SHA256 hash of a file."""
-        sha256_hash = hashlib.sha256()
+    def compute_file_hash(self, file_path: str, multithreaded: bool = True) -> str:
+        """
+        Compute the hash of a file with the configured hash algorithm (SHA256 by default).
+        
+        multithreaded lets BLAKE3 use all cores; fetch disables it while a process
+        pool is extracting pages, as the cores are already busy.
+        """
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            return _hash_file(file_path, self.hash_algorithm, multithreaded=multithreaded)
         except Exception as e:
             self.logger.error(f"Error computing file hash: {e}")
             return ""
     
-    def extract_text_from_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    @classmethod
+    def compute_file_hashes_batch(cls, paths: List[str], hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+                                  max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Compute the hashes of several files concurrently.
+        
+        Files are hashed on a thread pool; both hashlib and blake3 release the GIL
+        while hashing, so independent files are processed in parallel.
+        
+        Args:
+            paths: Paths of the files to hash
+            hash_algorithm: "sha256" or "blake3"
+            max_workers: Maximum number of hashing threads (default: os.cpu_count())
+            
+        Returns:
+            Dict[str, str]: Mapping of path to hex digest ("" if the file could not be hashed)
+        """
+        logger = logging.getLogger(__name__)
+        unique_paths = list(dict.fromkeys(paths))
+        hashes = {}
+        if not unique_paths:
+            return hashes
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(unique_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                path: executor.submit(_hash_file, path, hash_algorithm)
+                for path in unique_paths
+            }
+            for path, future in futures.items():
+                try:
+                    hashes[path] = future.result()
+                except Exception as e:
+                    logger.error(f"Error computing file hash for {path}: {e}")
+                    hashes[path] = ""
+        
+        return hashes
+    
+    def _pool_workers(self, total_pages: int) -> int:
+        """Return the number of pool processes to use for a document, or 0 to extract in-process."""
+        try:
+            num_workers = int(self.num_workers)
+        except (TypeError, ValueError):
+            # Reported by validate_config; extract in-process if it was skipped
+            return 0
+        if num_workers > 1 and total_pages >= PARALLEL_MIN_PAGES:
+            return min(num_workers, total_pages)
+        return 0
+    
+    def _create_process_pool(self, total_pages: int):
+        """
+        Create the page-extraction process pool for a document and start its workers.
+        
+        Workers are forked right away, so callers can start threads (such as the
+        background file hash) afterwards without forking a multi-threaded process.
+        Fork keeps the caller's __main__ untouched; platforms without it use their
+        default start method.
+        
+        Returns:
+            A started ProcessPoolExecutor, or a nullcontext (yielding None) when the
+            document should be extracted in-process
+        """
+        workers = self._pool_workers(total_pages)
+        if not workers:
+            return nullcontext()
+        
+        context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        # The executor launches its worker processes when the first task is submitted
+        executor.submit(_noop).result()
+        return executor
+    
+    def _iter_page_texts(self, pdf_path: str, document, total_pages: int,
+                         executor: Optional[ProcessPoolExecutor] = None) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        """
+        Yield (text, error) for every page of a PDF, in page order.
+        
+        Large documents are split across a process pool (the given executor, or one
+        created here); small ones, or when num_workers is 1, are extracted in-process
+        from the already opened document.
+        """
+        workers = self._pool_workers(total_pages)
+        if executor is None and workers:
+            with self._create_process_pool(total_pages) as executor:
+                yield from self._iter_page_texts(pdf_path, document, total_pages, executor)
+            return
+        
+        if executor is not None:
+            chunksize = max(1, total_pages // (4 * max(1, workers)))
+            yield from executor.map(
+                _extract_page,
+                repeat(pdf_path),
+                range(total_pages),
+                repeat(self.backend),
+                chunksize=chunksize
+            )
+            return
+        
+        for page_num in range(total_pages):
+            try:
+                yield _extract_page_text(document, page_num, self.backend), None
+            except Exception as e:
+                yield None, str(e)
+    
+    def _notify_progress(self) -> None:
+        """Call the progress callback, if set, with the current progress."""
+        if self.progress_callback:
+            self.progress_callback(
+                self.get_name(),
+                self.get_total_to_process(),
+                self.get_total_processed(),
+                self.estimated_remaining_time()
+            )
+    
+    def _set_processed_items(self, processed: int) -> None:
+        """Set the number of processed pages in one step (the counter is initialized in __init__)."""
+        self._processed_items = processed
+    
+    def extract_text_from_pdf(self, pdf_path: str, document=None,
+                              executor: Optional[ProcessPoolExecutor] = None) -> Dict[str, Any]:
         """
         Extract text from a PDF file.
         
         Args:
             pdf_path: Path to the PDF file
+            document: Document already opened with the configured backend (optional).
+                When given it is reused and left open for the caller to close.
+            executor: Started process pool from _create_process_pool (optional).
+                When not given, a pool is created here if the document is large enough.
             
         Returns:
             Dict[str, Any]: Dictionary containing extracted text and metadata
@@ -125,75 +708,115 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
             'pages': [],
             'full_text': '',
             'total_pages': 0,
-            'total_characters': 0
+            'total_characters': 0,
+            'pages_with_text': 0
         }
         
+        owns_document = document is None
+        if owns_document:
+            try:
+                document = _open_pdf(pdf_path, self.backend)
+            except Exception as e:
+                self.logger.error(f"Error reading PDF {pdf_path}: {e}")
+                raise
+        
         try:
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
+            total_pages: int = _document_page_count(document, self.backend)
             extracted_data['total_pages'] = total_pages
             
-            full_text_parts = []
+            # Full text is assembled in a single pass into one growing buffer
+            buf = io.StringIO()
+            pages_with_text: int = 0
+            progress_interval: int = max(1, total_pages // PROGRESS_UPDATES_PER_DOCUMENT)
             
-            for page_num in range(total_pages):
-                try:
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
+            # Bind everything the loop touches to locals once, outside the loop
+            write = buf.write
+            append_page = extracted_data['pages'].append
+            include_page_numbers: bool = bool(self.include_page_numbers)
+            store_per_page: bool = bool(self.store_per_page)
+            
+            page_num: int
+            text: Optional[str]
+            error: Optional[str]
+            
+            # Results arrive in page order, also from the process pool, so progress is
+            # only ever updated here in the main process
+            for page_num, (text, error) in enumerate(self._iter_page_texts(pdf_path, document, total_pages, executor)):
+                if error is not None:
+                    self.logger.warning(f"Error processing page {page_num + 1} in {pdf_path}: {error}")
+                elif text:
+                    if include_page_numbers:
+                        # Page separator with page number
+                        write(PAGE_HEADER_PREFIX if pages_with_text else FIRST_PAGE_HEADER_PREFIX)
+                        write(str(page_num + 1))
+                        write(PAGE_HEADER_SUFFIX)
+                    elif pages_with_text:
+                        write(PAGE_SEPARATOR)
+                    write(text)
                     
-                    if text:
-                        page_data = {
+                    pages_with_text += 1
+                    if store_per_page:
+                        append_page({
                             'page_number': page_num + 1,
                             'text': text,
                             'character_count': len(text)
-                        }
-                        extracted_data['pages'].append(page_data)
-                        full_text_parts.append(text)
-                        
-                        # Update progress
-                        self.increment_processed_items()
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing page {page_num + 1} in {pdf_path}: {e}")
-                    continue
+                        })
+                
+                # Update progress every progress_interval consumed pages (blank and
+                # failed pages included) rather than once per page
+                if (page_num + 1) % progress_interval == 0:
+                    self._set_processed_items(pages_with_text)
             
-            # Combine all text
-            if self.include_page_numbers:
-                # Add page separators with page numbers
-                formatted_parts = []
-                for page_data in extracted_data['pages']:
-                    formatted_parts.append(f"\n--- Page {page_data['page_number']} ---\n")
-                    formatted_parts.append(page_data['text'])
-                extracted_data['full_text'] = '\n'.join(formatted_parts)
-            else:
-                extracted_data['full_text'] = '\n\n'.join(full_text_parts)
+            if total_pages % progress_interval:
+                self._set_processed_items(pages_with_text)
             
+            extracted_data['full_text'] = buf.getvalue()
             extracted_data['total_characters'] = len(extracted_data['full_text'])
+            extracted_data['pages_with_text'] = pages_with_text
             
         except Exception as e:
             self.logger.error(f"Error reading PDF {pdf_path}: {e}")
             raise
+        finally:
+            if owns_document:
+                _close_document(document)
         
         return extracted_data
     
-    def create_json_structure(self, pdf_path: str, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_json_structure(self, pdf_path: str, extracted_data: Dict[str, Any],
+                              file_hash: Optional[str] = None,
+                              file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Create the JSON structure with metadata as first node.
         
         Args:
             pdf_path: Path to the PDF file
             extracted_data: Dictionary containing extracted text and page data
+            file_hash: Precomputed hash of the PDF file (computed if not given)
+            file_stat: Precomputed os.stat result of the PDF file (computed if not given)
             
         Returns:
-            Dict[str, Any]: Complete JSON structure
+            Dict[str, Any]: Complete JSON structure. content.pages is empty when
+                store_per_page is disabled; metadata.pages_with_text is still reported.
         """
-        # Get file metadata
-        file_stat = os.stat(pdf_path)
-        file_name = os.path.basename(pdf_path)
-        file_base_name = os.path.splitext(file_name)[0]
+        # Get file metadata, reusing what validate_config cached for the configured PDF
+        if pdf_path == self.pdf_file_path and self._pdf_basename is not None:
+            file_name = self._pdf_basename
+            file_base_name = self._pdf_stem
+            file_abspath = self._pdf_abspath
+            if file_stat is None:
+                file_stat = self._pdf_stat
+        else:
+            file_name = os.path.basename(pdf_path)
+            file_base_name = os.path.splitext(file_name)[0]
+            file_abspath = os.path.abspath(pdf_path)
+        if file_stat is None:
+            file_stat = os.stat(pdf_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(pdf_path)
         file_size = file_stat.st_size
-        file_hash = self.compute_file_hash(pdf_path)
-        modified_time = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-        current_timestamp = datetime.now().isoformat()
+        modified_time = time.strftime(ISO_TIMESTAMP_FORMAT, time.localtime(file_stat.st_mtime))
+        current_timestamp = time.strftime(ISO_TIMESTAMP_FORMAT)
         
         # Create JSON structure with metadata as first node
         json_structure = {
@@ -202,13 +825,14 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
                 "data_type": "from_pdf",
                 "timestamp": current_timestamp,
                 "pdf_file_name": file_name,
-                "pdf_file_path": os.path.abspath(pdf_path),
+                "pdf_file_path": file_abspath,
                 "pdf_file_size": file_size,
                 "pdf_file_hash": file_hash,
+                "pdf_file_hash_algorithm": self.hash_algorithm,
                 "pdf_modified_time": modified_time,
                 "total_pages": extracted_data['total_pages'],
                 "total_characters": extracted_data['total_characters'],
-                "pages_with_text": len(extracted_data['pages']),
+                "pages_with_text": extracted_data.get('pages_with_text', len(extracted_data['pages'])),
                 "extraction_timestamp": current_timestamp
             },
             "content": {
@@ -219,6 +843,51 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
         
         return json_structure
     
+    def write_json_output(self, json_structure: Dict[str, Any], f) -> None:
+        """
+        Write the JSON structure to an open binary file.
+        
+        The document is streamed section by section (metadata, full text, then one
+        page at a time) so that the serialized form of the whole structure never has
+        to be held in memory. With pretty_print enabled the structure is serialized
+        with a 2-space indent in one call instead. orjson is used for encoding when
+        installed, with the standard library json module as fallback.
+        
+        Args:
+            json_structure: Structure returned by create_json_structure
+            f: Binary file opened for writing
+        """
+        if self.pretty_print:
+            f.write(_json_dumps(json_structure, indent=True))
+            return
+        
+        content = json_structure['content']
+        f.write(b'{"metadata":')
+        f.write(_json_dumps(json_structure['metadata']))
+        f.write(b',"content":{"full_text":')
+        f.write(_json_dumps(content['full_text']))
+        f.write(b',"pages":[')
+        for index, page_data in enumerate(content['pages']):
+            if index:
+                f.write(b',')
+            f.write(_json_dumps(page_data))
+        f.write(b']}}')
+    
+    @contextmanager
+    def _open_output_file(self):
+        """Open the output file for binary writing, compressing according to output_compression."""
+        with open(self.output_file_path, 'wb') as raw:
+            if self.output_compression == 'gzip':
+                with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=GZIP_COMPRESSION_LEVEL) as f:
+                    yield f
+            elif self.output_compression == 'zstd':
+                # threads=-1 compresses on all cores
+                compressor = zstd.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL, threads=-1)
+                with compressor.stream_writer(raw) as f:
+                    yield f
+            else:
+                yield raw
+    
     def fetch(self) -> List[Dict[str, Any]]:
         """
         Fetch data from the data source - convert PDF to JSON.
@@ -226,49 +895,85 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
         Returns:
             List[Dict[str, Any]]: List containing the converted JSON data
         """
+        if not self._validate_for_fetch():
+            return []
+        return self._fetch_validated()
+    
+    def _validate_for_fetch(self) -> bool:
+        """Validate the configuration and the PDF file header before converting."""
         try:
             if not self.validate_config():
-                return []
-            
-            self.logger.info(f"Starting PDF to JSON conversion for: {self.pdf_file_path}")
+                return False
             
             # Validate PDF file
             if not self.is_valid_pdf(self.pdf_file_path):
                 self.logger.error(f"Invalid PDF file: {self.pdf_file_path}")
-                return []
+                return False
             
-            # Set total items for progress tracking (total pages)
-            reader = PdfReader(self.pdf_file_path)
-            total_pages = len(reader.pages)
-            self.set_total_items(total_pages)
+            return True
             
-            # Extract text from PDF
-            start_time = datetime.now()
-            extracted_data = self.extract_text_from_pdf(self.pdf_file_path)
+        except Exception as e:
+            self.logger.error(f"Error in fetch: {e}")
+            return False
+    
+    def _fetch_validated(self) -> List[Dict[str, Any]]:
+        """
+        Convert the PDF to JSON once _validate_for_fetch has passed.
+        
+        Returns:
+            List[Dict[str, Any]]: List containing the converted JSON data
+        """
+        try:
+            self.logger.info(f"Starting PDF to JSON conversion for: {self.pdf_file_path}")
+            
+            # Open the PDF once and share it between page counting and extraction
+            try:
+                document = _open_pdf(self.pdf_file_path, self.backend)
+            except Exception as e:
+                self.logger.error(f"Invalid PDF file: {self.pdf_file_path} ({e})")
+                return []
+            
+            try:
+                # Set total items for progress tracking (total pages)
+                total_pages = _document_page_count(document, self.backend)
+                self.set_total_items(total_pages)
+                
+                # The extraction pool forks its workers before the hash thread starts;
+                # the file is then hashed on that thread while the text is extracted
+                # (hashing releases the GIL so the two genuinely overlap)
+                with self._create_process_pool(total_pages) as pool, \
+                        ThreadPoolExecutor(max_workers=1) as hash_executor:
+                    hash_future = None
+                    if self._precomputed_file_hash is None:
+                        hash_future = hash_executor.submit(
+                            self.compute_file_hash, self.pdf_file_path, pool is None
+                        )
+                    
+                    # Extract text from PDF
+                    start_time = datetime.now()
+                    extracted_data = self.extract_text_from_pdf(self.pdf_file_path, document, pool)
+                    
+                    file_hash = hash_future.result() if hash_future else self._precomputed_file_hash
+            finally:
+                _close_document(document)
             
             # Create JSON structure
-            json_structure = self.create_json_structure(self.pdf_file_path, extracted_data)
+            json_structure = self.create_json_structure(self.pdf_file_path, extracted_data, file_hash=file_hash)
             
             # Save to output file
             output_dir = os.path.dirname(self.output_file_path)
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir, exist_ok=True)
             
-            with open(self.output_file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_structure, f, indent=2, ensure_ascii=False)
+            with self._open_output_file() as f:
+                self.write_json_output(json_structure, f)
             
             self.logger.info(f"Successfully converted PDF to JSON: {self.output_file_path}")
             self.set_total_processing_time((datetime.now() - start_time).total_seconds())
             self.set_fetch_completed(True)
             
             # Call progress callback if set
-            if self.progress_callback:
-                self.progress_callback(
-                    self.get_name(),
-                    self.get_total_to_process(),
-                    self.get_total_processed(),
-                    self.estimated_remaining_time()
-                )
+            self._notify_progress()
             
             # Call status callback if set
             if self.status_callback:
@@ -283,6 +988,43 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
             self.logger.error(f"Error in fetch: {e}")
             return []
     
+    @classmethod
+    def fetch_batch(cls, data_sources: List['SubjectivePdfToTextDataSource']) -> List[Dict[str, Any]]:
+        """
+        Fetch several PDF data sources, hashing all of their files in one batch.
+        
+        Each data source is validated once (configuration and PDF header); the files of
+        those that pass are hashed up front with compute_file_hashes_batch (one batch
+        per hash algorithm) and converted with their hash already known. Data sources
+        that fail validation are skipped.
+        
+        Args:
+            data_sources: Data sources to fetch
+            
+        Returns:
+            List[Dict[str, Any]]: Converted JSON data of every data source that succeeded
+        """
+        valid_data_sources = [data_source for data_source in data_sources if data_source._validate_for_fetch()]
+        
+        paths_by_algorithm = {}
+        for data_source in valid_data_sources:
+            paths_by_algorithm.setdefault(data_source.hash_algorithm, []).append(data_source.pdf_file_path)
+        
+        hashes = {}
+        for hash_algorithm, paths in paths_by_algorithm.items():
+            for path, file_hash in cls.compute_file_hashes_batch(paths, hash_algorithm).items():
+                hashes[(hash_algorithm, path)] = file_hash
+        
+        results = []
+        for data_source in valid_data_sources:
+            data_source._precomputed_file_hash = hashes.get((data_source.hash_algorithm, data_source.pdf_file_path))
+            try:
+                results.extend(data_source._fetch_validated())
+            finally:
+                data_source._precomputed_file_hash = None
+        
+        return results
+    
     def get_icon(self) -> str:
         """
         Get the SVG icon content for this data source.
@@ -291,42 +1033,7 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
             str: SVG icon content if icon.svg exists, otherwise a fallback string
         """
         try:
-            # Get the directory where this class file is located
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(current_dir, "icon.svg")
-            
-            if os.path.exists(icon_path):
-                with open(icon_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                # Fallback SVG icon for PDF to text
-                return '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="64" height="64" viewBox="0 0 64 64" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <linearGradient id="gradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#4ECDC4;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#4ECDC480;stop-opacity:1" />
-    </linearGradient>
-  </defs>
-  
-  <!-- Background circle -->
-  <circle cx="32" cy="32" r="30" fill="url(#gradient)" stroke="#333" stroke-width="2"/>
-  
-  <!-- PDF icon symbol -->
-  <text x="32" y="42" font-family="Arial, sans-serif" font-size="24" text-anchor="middle" fill="white">
-    📄
-  </text>
-  
-  <!-- Data source type indicator -->
-  <text x="32" y="56" font-family="Arial, sans-serif" font-size="8" text-anchor="middle" fill="#333">
-    PDF→JSON
-  </text>
-  
-  <!-- Corner indicator for Subjective Technologies -->
-  <circle cx="52" cy="12" r="8" fill="#333" opacity="0.8"/>
-  <text x="52" y="16" font-family="Arial, sans-serif" font-size="8" text-anchor="middle" fill="white">S</text>
-</svg>'''
-                
+            return _load_icon(_MODULE_DIR)
         except Exception as e:
             self.logger.error(f"Error reading icon file: {e}")
             # Return a simple fallback string
@@ -337,60 +1044,20 @@ class SubjectivePdfToTextDataSource(SubjectiveDataSource):
         Return the connection type and required fields for this data source.
         
         Returns:
-            Dict[str, Any]: Connection data dictionary
-        """
-        return {
-            "connection_type": "FileSystem",
-            "fields": {
-                "pdf_file_path": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Path to the PDF file to convert"
-                },
-                "output_file_path": {
-                    "type": "string", 
-                    "required": False,
-                    "description": "Path for output JSON file (defaults to PDF name with .json extension)"
-                },
-                "include_page_numbers": {
-                    "type": "bool",
-                    "required": False,
-                    "default": True,
-                    "description": "Whether to include page numbers in extracted text"
-                }
-            }
-        }
+            Dict[str, Any]: Connection data dictionary. The same dict is returned on
+                every call and must not be modified; copy it first if needed.
+        """
+        return _CONNECTION_DATA
     
     def get_connection_metadata(self) -> Dict[str, Any]:
         """
         Get connection metadata for interactive parameter collection.
         
         Returns:
-            Dict[str, Any]: Dictionary describing required connection parameters
-        """
-        return {
-            'pdf_file_path': {
-                'description': 'Path to the PDF file to convert to JSON',
-                'type': 'string',
-                'required': True,
-                'default': '',
-                'sensitive': False
-            },
-            'output_file_path': {
-                'description': 'Path for output JSON file (optional, defaults to PDF name with .json extension)',
-                'type': 'string',
-                'required': False,
-                'default': '',
-                'sensitive': False
-            },
-            'include_page_numbers': {
-                'description': 'Whether to include page numbers in extracted text',
-                'type': 'bool',
-                'required': False,
-                'default': True,
-                'sensitive': False
-            }
-        }
+            Dict[str, Any]: Dictionary describing required connection parameters. The same
+                dict is returned on every call and must not be modified; copy it first if needed.
+        """
+        return _CONNECTION_METADATA
 
 
 def main():
@@ -412,7 +1079,13 @@ def main():
     params = {
         'pdf_file_path': os.getenv('PDF_FILE_PATH', ''),
         'output_file_path': os.getenv('OUTPUT_FILE_PATH', ''),
-        'include_page_numbers': os.getenv('INCLUDE_PAGE_NUMBERS', 'true').lower() == 'true'
+        'include_page_numbers': os.getenv('INCLUDE_PAGE_NUMBERS', 'true').lower() == 'true',
+        'backend': os.getenv('PDF_BACKEND', DEFAULT_BACKEND),
+        'num_workers': os.getenv('NUM_WORKERS', ''),
+        'pretty_print': os.getenv('PRETTY_PRINT', 'false').lower() == 'true',
+        'hash_algorithm': os.getenv('HASH_ALGORITHM', DEFAULT_HASH_ALGORITHM),
+        'store_per_page': os.getenv('STORE_PER_PAGE', 'true').lower() == 'true',
+        'output_compression': os.getenv('OUTPUT_COMPRESSION', DEFAULT_OUTPUT_COMPRESSION)
     }
     
     # Create and run data source